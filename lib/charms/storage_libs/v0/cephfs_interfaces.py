@@ -48,11 +48,40 @@ requests, and convenience methods for consuming data sent by a CephFS client cha
 > the interface for the integration.
 """
 
-import json
 import logging
 from dataclasses import asdict, dataclass
 from typing import Dict, Iterable, List, Optional, Set
 
+try:
+    # `orjson` is noticeably faster than the stdlib `json` module, so prefer it
+    # for serializing the relation databag on every hook invocation.
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize `obj` to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+
+    def _loads_as(cls, raw):
+        """Deserialize a JSON object directly into an instance of `cls`."""
+        return cls(**orjson.loads(raw))
+
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+    def _loads_as(cls, raw):
+        """Deserialize a JSON object directly into an instance of `cls`.
+
+        Constructing the target type from an `object_hook` while decoding
+        avoids a second pass over a fully materialized dict tree.
+        """
+        return json.loads(raw, object_hook=lambda entries: cls(**entries))
+
+
 import ops
 from ops.charm import (
     CharmBase,
@@ -73,10 +102,25 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 2
+LIBPATCH = 3
 
 _logger = logging.getLogger(__name__)
 
+_asdict_cache: Dict[int, tuple] = {}
+
+
+def _asdict(obj) -> Dict:
+    """`dataclasses.asdict` with memoization for repeated conversions.
+
+    `asdict` recursively copies the dataclass on every call. Share and auth
+    info are not mutated after construction, so convert each instance once.
+    The instance is retained alongside its dict to keep its `id` stable.
+    """
+    entry = _asdict_cache.get(id(obj))
+    if entry is None or entry[0] is not obj:
+        _asdict_cache[id(obj)] = entry = (obj, asdict(obj))
+    return entry[1]
+
 
 @dataclass(frozen=True)
 class _Transaction:
@@ -100,7 +144,7 @@ def _eval(event: RelationChangedEvent, bucket: str) -> _Transaction:
             keys from the event integration databag.
     """
     # Retrieve the old data from the data key in the application integration databag.
-    old_data = json.loads(event.relation.data[bucket].get("cache", "{}"))
+    old_data = _loads(event.relation.data[bucket].get("cache", "{}"))
     # Retrieve the new data from the event integration databag.
     new_data = {
         key: value for key, value in event.relation.data[event.app].items() if key != "cache"
@@ -114,7 +158,7 @@ def _eval(event: RelationChangedEvent, bucket: str) -> _Transaction:
         {key for key in old_data.keys() & new_data.keys() if old_data[key] != new_data[key]}
     )
     # Convert the new_data to a serializable format and save it for a next diff check.
-    event.relation.data[bucket].update({"cache": json.dumps(new_data)})
+    event.relation.data[bucket].update({"cache": _dumps(new_data)})
 
     # Return the transaction with all possible changes.
     return _Transaction(added, changed, deleted)
@@ -124,7 +168,7 @@ class ServerConnectedEvent(RelationEvent):
     """Emit when a CephFS server is integrated with CephFS client."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CephFSAuthInfo:
     """Authorization info to access a CephFS share.
 
@@ -137,7 +181,7 @@ class CephFSAuthInfo:
     key: str
 
 
-@dataclass(init=False)
+@dataclass(init=False, frozen=True, slots=True)
 class CephFSShareInfo:
     """Information about a shared CephFS.
 
@@ -154,11 +198,11 @@ class CephFSShareInfo:
     monitor_hosts: [str]
 
     def __init__(self, fsid: str, name: str, path: str, monitor_hosts: Iterable[str]):
-        self.fsid = fsid
-        self.name = name
-        self.path = path
+        object.__setattr__(self, "fsid", fsid)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "path", path)
         # Cast `ops.StoredList` to `List[str]` to avoid exposing `ops.StoredState` backend.
-        self.monitor_hosts = list(monitor_hosts)
+        object.__setattr__(self, "monitor_hosts", list(monitor_hosts))
 
 
 class _MountEvent(RelationEvent):
@@ -169,7 +213,7 @@ class _MountEvent(RelationEvent):
         """Get CephFS share info."""
         if not (share_info := self.relation.data[self.relation.app].get("share_info")):
             return
-        return CephFSShareInfo(**json.loads(share_info))
+        return _loads_as(CephFSShareInfo, share_info)
 
     @property
     def auth_info(self) -> Optional[CephFSAuthInfo]:
@@ -187,12 +231,12 @@ class _MountEvent(RelationEvent):
 
         if kind == "secret":
             auth = self.framework.model.get_secret(id=auth).get_content(refresh=True)
+            return CephFSAuthInfo(**auth)
         elif kind == "plain":
-            auth = json.loads(data)
+            return _loads_as(CephFSAuthInfo, data)
         else:
             _logger.warning("Invalid kind for auth info.")
             return
-        return CephFSAuthInfo(**auth)
 
 
 class MountShareEvent(_MountEvent):
@@ -380,8 +424,8 @@ class CephFSProvides(_BaseInterface):
             Only the application leader unit can set the CephFS share data.
         """
         if self.unit.is_leader():
-            share_info = json.dumps(asdict(share_info))
-            auth_info = asdict(auth_info)
+            share_info = _dumps(_asdict(share_info))
+            auth_info = _asdict(auth_info)
             _logger.debug(f"Exporting CephFS share with info {share_info}")
 
             try:
@@ -126,11 +126,26 @@ The NFSProvides class only provides one custom event:
 > the interface for the integration.
 """
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Union
 
+try:
+    # `orjson` is noticeably faster than the stdlib `json` module, so prefer it
+    # for serializing the relation databag on every hook invocation.
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize `obj` to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
 from ops.charm import (
     CharmBase,
     CharmEvents,
@@ -150,7 +165,7 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 3
+LIBPATCH = 4
 
 _logger = logging.getLogger(__name__)
 
@@ -177,7 +192,7 @@ def _eval(event: RelationChangedEvent, bucket: str) -> _Transaction:
             keys from the event integration databag.
     """
     # Retrieve the old data from the data key in the application integration databag.
-    old_data = json.loads(event.relation.data[bucket].get("cache", "{}"))
+    old_data = _loads(event.relation.data[bucket].get("cache", "{}"))
     # Retrieve the new data from the event integration databag.
     new_data = {
         key: value for key, value in event.relation.data[event.app].items() if key != "cache"
@@ -189,7 +204,7 @@ def _eval(event: RelationChangedEvent, bucket: str) -> _Transaction:
     # These are the keys that already existed in the databag, but had their values changed.
     changed = {key for key in old_data.keys() & new_data.keys() if old_data[key] != new_data[key]}
     # Convert the new_data to a serializable format and save it for a next diff check.
-    event.relation.data[bucket].update({"cache": json.dumps(new_data)})
+    event.relation.data[bucket].update({"cache": _dumps(new_data)})
 
     # Return the transaction with all possible changes.
     return _Transaction(added, changed, deleted)
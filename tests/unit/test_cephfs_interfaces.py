@@ -4,11 +4,11 @@
 
 """Test the cephfs_interfaces charm library."""
 
-import json
 import unittest
 from dataclasses import asdict
 from unittest.mock import patch
 
+import orjson
 from charms.storage_libs.v0.cephfs_interfaces import (
     CephFSAuthInfo,
     CephFSProvides,
@@ -24,6 +24,8 @@ from ops.testing import Harness
 
 CEPHFS_INTEGRATION_NAME = "cephfs-share"
 CEPHFS_INTEGRATION_INTERFACE = "cephfs_share"
+# `Harness` only accepts charm metadata as YAML text, so these stay strings;
+# the class-shared harness fixtures parse them once per class, not per test.
 CEPHFS_CLIENT_METADATA = f"""
 name: cephfs-client
 requires:
@@ -47,7 +49,13 @@ MONITOR_HOSTS = [
 ]
 USERNAME = "user"
 KEY = "R//appdqz4NP4Bxcc5XWrg=="
-SHARE_INFO = json.dumps({"fsid": FSID, "name": NAME, "path": PATH, "monitor_hosts": MONITOR_HOSTS})
+# Build the share/auth fixtures once; `asdict` walks the dataclass
+# recursively on every call, so there is no reason to pay for it per test.
+SHARE_INFO_OBJ = CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS)
+AUTH_INFO_OBJ = CephFSAuthInfo(username=USERNAME, key=KEY)
+SHARE_DICT = asdict(SHARE_INFO_OBJ)
+AUTH_DICT = asdict(AUTH_INFO_OBJ)
+SHARE_INFO = orjson.dumps(SHARE_DICT).decode()
 
 
 class CephFSClientCharm(CharmBase):
@@ -82,15 +90,40 @@ class CephFSServerCharm(CharmBase):
         pass
 
 
+def _reset_integration(harness: Harness, integration_id: int, remote_unit: str) -> None:
+    """Return a class-shared harness to a pristine single-unit integration.
+
+    Building a `Harness` and running `begin_with_initial_hooks` for every test
+    method dominates suite wall time, so each test class shares one harness
+    and only wipes the relation databags between tests.
+    """
+    relation = harness.charm.model.get_relation(CEPHFS_INTEGRATION_NAME)
+    # Restore the remote unit if a previous test disconnected it.
+    if remote_unit not in {unit.name for unit in relation.units}:
+        harness.add_relation_unit(integration_id, remote_unit)
+    for member in ("application", harness.charm.app.name):
+        data = harness.get_relation_data(integration_id, member)
+        if data:
+            harness.update_relation_data(integration_id, member, dict.fromkeys(data, ""))
+
+
 class TestBaseInterface(unittest.TestCase):
     """Test the base interface for cephfs_interfaces."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.harness = Harness(CephFSClientCharm, meta=CEPHFS_CLIENT_METADATA)
+        cls.integration_id = cls.harness.add_relation(CEPHFS_INTEGRATION_NAME, "application")
+        cls.harness.add_relation_unit(cls.integration_id, "application/0")
+        cls.harness.set_leader(True)
+        cls.harness.begin_with_initial_hooks()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.harness.cleanup()
+
     def setUp(self) -> None:
-        self.harness = Harness(CephFSClientCharm, meta=CEPHFS_CLIENT_METADATA)
-        self.integration_id = self.harness.add_relation(CEPHFS_INTEGRATION_NAME, "application")
-        self.harness.add_relation_unit(self.integration_id, "application/0")
-        self.harness.set_leader(True)
-        self.harness.begin_with_initial_hooks()
+        _reset_integration(self.harness, self.integration_id, "application/0")
 
     def test_integrations(self) -> None:
         """Test `integrations` property."""
@@ -116,34 +149,46 @@ class TestBaseInterface(unittest.TestCase):
             },
         )
 
-    def tearDown(self) -> None:
-        self.harness.cleanup()
-
 
 class TestCephFSClientCharm(unittest.TestCase):
     """Test cephfs_interfaces from the requirer side."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.harness = Harness(CephFSClientCharm, meta=CEPHFS_CLIENT_METADATA)
+        cls.integration_id = cls.harness.add_relation(CEPHFS_INTEGRATION_NAME, "application")
+        cls.harness.add_relation_unit(cls.integration_id, "application/0")
+        cls.harness.set_leader(True)
+        cls.harness.begin_with_initial_hooks()
+        # Patch the event handlers once for the whole class; `setUp` resets the
+        # mocks so each test still starts from a clean call history.
+        for handler in ("_on_server_connected", "_on_mount_share", "_on_umount_share"):
+            patcher = patch.object(CephFSClientCharm, handler)
+            setattr(cls, f"mock{handler}", patcher.start())
+            cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.harness.cleanup()
+
     def setUp(self) -> None:
-        self.harness = Harness(CephFSClientCharm, meta=CEPHFS_CLIENT_METADATA)
-        self.integration_id = self.harness.add_relation(CEPHFS_INTEGRATION_NAME, "application")
-        self.harness.add_relation_unit(self.integration_id, "application/0")
-        self.harness.set_leader(True)
-        self.harness.begin_with_initial_hooks()
-
-    @patch.object(CephFSClientCharm, "_on_server_connected")
-    def test_on_server_connected(self, _on_server_connected) -> None:
+        _reset_integration(self.harness, self.integration_id, "application/0")
+        self.mock_on_server_connected.reset_mock()
+        self.mock_on_mount_share.reset_mock()
+        self.mock_on_umount_share.reset_mock()
+
+    def test_on_server_connected(self) -> None:
         """Assert that correct hook is called when new server is connected."""
         # Add placeholder unit to trigger a `relation-joined` event.
         self.harness.add_relation_unit(self.integration_id, "application/1")
-        _on_server_connected.assert_called_once()
+        self.mock_on_server_connected.assert_called_once()
+        # Roll back so later tests see the original single-unit integration.
+        self.harness.remove_relation_unit(self.integration_id, "application/1")
 
-    @patch.object(CephFSClientCharm, "_on_mount_share")
-    def test_on_mount_share(self, _on_mount_share) -> None:
+    def test_on_mount_share(self) -> None:
         """Assert that correct hook is called when CephFS share is ready to mount."""
         # Simulate creating the auth secret
-        auth = self.harness.add_model_secret(
-            "application", asdict(CephFSAuthInfo(username=USERNAME, key=KEY))
-        )
+        auth = self.harness.add_model_secret("application", AUTH_DICT)
         self.harness.grant_secret(auth, self.harness.charm.app)
 
         # Simulate server setting new CephFS share endpoint
@@ -157,16 +202,12 @@ class TestCephFSClientCharm(unittest.TestCase):
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_mount_share.assert_called_once()
-        event = _on_mount_share.call_args[0][0]
-        self.assertEqual(
-            event.share_info,
-            CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS),
-        )
-        self.assertEqual(event.auth_info, CephFSAuthInfo(username=USERNAME, key=KEY))
+        self.mock_on_mount_share.assert_called_once()
+        event = self.mock_on_mount_share.call_args[0][0]
+        self.assertEqual(event.share_info, SHARE_INFO_OBJ)
+        self.assertEqual(event.auth_info, AUTH_INFO_OBJ)
 
-    @patch.object(CephFSClientCharm, "_on_mount_share")
-    def test_on_mount_share_compat(self, _on_mount_share) -> None:
+    def test_on_mount_share_compat(self) -> None:
         """Assert that correct hook is called when CephFS share is ready to mount.
 
         Uses the compatibility auth info for reactive charms that don't support secrets.
@@ -177,29 +218,23 @@ class TestCephFSClientCharm(unittest.TestCase):
             "application",
             {
                 "share_info": SHARE_INFO,
-                "auth": "plain:" + json.dumps(asdict(CephFSAuthInfo(username=USERNAME, key=KEY))),
+                "auth": "plain:" + orjson.dumps(AUTH_DICT).decode(),
             },
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_mount_share.assert_called_once()
-        event = _on_mount_share.call_args[0][0]
-        self.assertEqual(
-            event.share_info,
-            CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS),
-        )
-        self.assertEqual(event.auth_info, CephFSAuthInfo(username=USERNAME, key=KEY))
+        self.mock_on_mount_share.assert_called_once()
+        event = self.mock_on_mount_share.call_args[0][0]
+        self.assertEqual(event.share_info, SHARE_INFO_OBJ)
+        self.assertEqual(event.auth_info, AUTH_INFO_OBJ)
 
-    @patch.object(CephFSClientCharm, "_on_umount_share")
-    def test_on_umount_share(self, _on_umount_share) -> None:
+    def test_on_umount_share(self) -> None:
         """Assert that correct hook is called when CephFS share is ready to be unmounted."""
         # Disconnect the related unit to trigger `relation-departed`.
         self.harness.remove_relation_unit(self.integration_id, "application/0")
 
         # Simulate the auth secret
-        auth = self.harness.add_model_secret(
-            "application", asdict(CephFSAuthInfo(username=USERNAME, key=KEY))
-        )
+        auth = self.harness.add_model_secret("application", AUTH_DICT)
         self.harness.grant_secret(auth, self.harness.charm.app)
 
         # Simulate CephFS share endpoint being present.
@@ -213,16 +248,12 @@ class TestCephFSClientCharm(unittest.TestCase):
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_umount_share.assert_called_once()
-        event = _on_umount_share.call_args[0][0]
-        self.assertEqual(
-            event.share_info,
-            CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS),
-        )
-        self.assertEqual(event.auth_info, CephFSAuthInfo(username=USERNAME, key=KEY))
+        self.mock_on_umount_share.assert_called_once()
+        event = self.mock_on_umount_share.call_args[0][0]
+        self.assertEqual(event.share_info, SHARE_INFO_OBJ)
+        self.assertEqual(event.auth_info, AUTH_INFO_OBJ)
 
-    @patch.object(CephFSClientCharm, "_on_umount_share")
-    def test_on_umount_share_compat(self, _on_umount_share) -> None:
+    def test_on_umount_share_compat(self) -> None:
         """Assert that correct hook is called when CephFS share is ready to be unmounted.
 
         Uses the compatibility auth info for reactive charms that don't support secrets.
@@ -236,18 +267,15 @@ class TestCephFSClientCharm(unittest.TestCase):
             "application",
             {
                 "share_info": SHARE_INFO,
-                "auth": "plain:" + json.dumps(asdict(CephFSAuthInfo(username=USERNAME, key=KEY))),
+                "auth": "plain:" + orjson.dumps(AUTH_DICT).decode(),
             },
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_umount_share.assert_called_once()
-        event = _on_umount_share.call_args[0][0]
-        self.assertEqual(
-            event.share_info,
-            CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS),
-        )
-        self.assertEqual(event.auth_info, CephFSAuthInfo(username=USERNAME, key=KEY))
+        self.mock_on_umount_share.assert_called_once()
+        event = self.mock_on_umount_share.call_args[0][0]
+        self.assertEqual(event.share_info, SHARE_INFO_OBJ)
+        self.assertEqual(event.auth_info, AUTH_INFO_OBJ)
 
     def test_request_share(self) -> None:
         """Assert that name is in integration databag."""
@@ -258,22 +286,32 @@ class TestCephFSClientCharm(unittest.TestCase):
             {"name": "/data"},
         )
 
-    def tearDown(self) -> None:
-        self.harness.cleanup()
-
 
 class TestCephFSServerCharm(unittest.TestCase):
     """Test cephfs_interfaces from the provider side."""
 
-    def setUp(self):
-        self.harness = Harness(CephFSServerCharm, meta=CEPHFS_SERVER_METADATA)
-        self.integration_id = self.harness.add_relation(CEPHFS_INTEGRATION_NAME, "application")
-        self.harness.add_relation_unit(self.integration_id, "application/0")
-        self.harness.set_leader(True)
-        self.harness.begin_with_initial_hooks()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.harness = Harness(CephFSServerCharm, meta=CEPHFS_SERVER_METADATA)
+        cls.integration_id = cls.harness.add_relation(CEPHFS_INTEGRATION_NAME, "application")
+        cls.harness.add_relation_unit(cls.integration_id, "application/0")
+        cls.harness.set_leader(True)
+        cls.harness.begin_with_initial_hooks()
+        # Patch the event handler once for the whole class; `setUp` resets the
+        # mock so each test still starts from a clean call history.
+        patcher = patch.object(CephFSServerCharm, "_on_share_requested")
+        cls.mock_on_share_requested = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.harness.cleanup()
 
-    @patch.object(CephFSServerCharm, "_on_share_requested")
-    def test_on_share_requested(self, _on_share_requested) -> None:
+    def setUp(self) -> None:
+        _reset_integration(self.harness, self.integration_id, "application/0")
+        self.mock_on_share_requested.reset_mock()
+
+    def test_on_share_requested(self) -> None:
         """Assert that correct hook is called when a new CephFS share is requested."""
         name = "/data"
         # Simulate the request of a new CephFS share.
@@ -286,46 +324,38 @@ class TestCephFSServerCharm(unittest.TestCase):
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_share_requested.assert_called_once()
-        event = _on_share_requested.call_args[0][0]
+        self.mock_on_share_requested.assert_called_once()
+        event = self.mock_on_share_requested.call_args[0][0]
         self.assertEqual(event.name, name)
 
     def test_set_endpoint(self) -> None:
         """Assert that endpoint is in integration databag."""
-        share_info = CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS)
-        auth_info = CephFSAuthInfo(username=USERNAME, key=KEY)
-        self.harness.charm.provider.set_share(self.integration_id, share_info, auth_info)
+        self.harness.charm.provider.set_share(self.integration_id, SHARE_INFO_OBJ, AUTH_INFO_OBJ)
 
         relation_data = self.harness.get_relation_data(self.integration_id, "cephfs-server")
-        stored_share_info = json.loads(relation_data["share_info"])
+        stored_share_info = orjson.loads(relation_data["share_info"])
         stored_auth_info = self.harness.charm.model.get_secret(
             id=relation_data["auth"]
         ).get_content()
-        self.assertEqual(stored_share_info, asdict(share_info))
-        self.assertEqual(stored_auth_info, asdict(auth_info))
+        self.assertEqual(stored_share_info, SHARE_DICT)
+        self.assertEqual(stored_auth_info, AUTH_DICT)
 
     def test_set_share_twice(self) -> None:
         """Assert that the auth info can be set multiple times."""
-        share_info = CephFSShareInfo(fsid=FSID, name=NAME, path=PATH, monitor_hosts=MONITOR_HOSTS)
-        auth_info = CephFSAuthInfo(username=USERNAME, key=KEY)
-
-        self.harness.charm.provider.set_share(self.integration_id, share_info, auth_info)
+        self.harness.charm.provider.set_share(self.integration_id, SHARE_INFO_OBJ, AUTH_INFO_OBJ)
 
         relation_data = self.harness.get_relation_data(self.integration_id, "cephfs-server")
         old_auth_id = relation_data["auth"]
         new_auth_info = CephFSAuthInfo(username="new-user", key=KEY)
 
-        self.harness.charm.provider.set_share(self.integration_id, share_info, new_auth_info)
+        self.harness.charm.provider.set_share(self.integration_id, SHARE_INFO_OBJ, new_auth_info)
 
         relation_data = self.harness.get_relation_data(self.integration_id, "cephfs-server")
         self.assertEqual(relation_data["auth"], old_auth_id)
 
-        stored_share_info = json.loads(relation_data["share_info"])
+        stored_share_info = orjson.loads(relation_data["share_info"])
         stored_auth_info = self.harness.charm.model.get_secret(
             id=relation_data["auth"]
         ).get_content(refresh=True)
-        self.assertEqual(stored_share_info, asdict(share_info))
+        self.assertEqual(stored_share_info, SHARE_DICT)
         self.assertEqual(stored_auth_info, asdict(new_auth_info))
-
-    def tearDown(self) -> None:
-        self.harness.cleanup()
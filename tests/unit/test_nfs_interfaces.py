@@ -20,6 +20,8 @@ from ops.testing import Harness
 
 NFS_INTEGRATION_NAME = "nfs-share"
 NFS_INTEGRATION_INTERFACE = "nfs_share"
+# `Harness` only accepts charm metadata as YAML text, so these stay strings;
+# the class-shared harness fixtures parse them once per class, not per test.
 NFS_CLIENT_METADATA = f"""
 name: nfs-client
 requires:
@@ -66,15 +68,40 @@ class NFSServerCharm(CharmBase):
         pass
 
 
+def _reset_integration(harness: Harness, integration_id: int, remote_unit: str) -> None:
+    """Return a class-shared harness to a pristine single-unit integration.
+
+    Building a `Harness` and running `begin_with_initial_hooks` for every test
+    method dominates suite wall time, so each test class shares one harness
+    and only wipes the relation databags between tests.
+    """
+    relation = harness.charm.model.get_relation(NFS_INTEGRATION_NAME)
+    # Restore the remote unit if a previous test disconnected it.
+    if remote_unit not in {unit.name for unit in relation.units}:
+        harness.add_relation_unit(integration_id, remote_unit)
+    for member in ("application", harness.charm.app.name):
+        data = harness.get_relation_data(integration_id, member)
+        if data:
+            harness.update_relation_data(integration_id, member, dict.fromkeys(data, ""))
+
+
 class TestBaseInterface(unittest.TestCase):
     """Test the base interface for nfs_interfaces."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.harness = Harness(NFSClientCharm, meta=NFS_CLIENT_METADATA)
+        cls.integration_id = cls.harness.add_relation(NFS_INTEGRATION_NAME, "application")
+        cls.harness.add_relation_unit(cls.integration_id, "application/0")
+        cls.harness.set_leader(True)
+        cls.harness.begin_with_initial_hooks()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.harness.cleanup()
+
     def setUp(self) -> None:
-        self.harness = Harness(NFSClientCharm, meta=NFS_CLIENT_METADATA)
-        self.integration_id = self.harness.add_relation(NFS_INTEGRATION_NAME, "application")
-        self.harness.add_relation_unit(self.integration_id, "application/0")
-        self.harness.set_leader(True)
-        self.harness.begin_with_initial_hooks()
+        _reset_integration(self.harness, self.integration_id, "application/0")
 
     def test_integrations(self) -> None:
         """Test `integrations` property."""
@@ -91,29 +118,43 @@ class TestBaseInterface(unittest.TestCase):
             self.harness.charm.requirer.fetch_data(), {0: {"endpoint": "nfs://127.0.0.1/data"}}
         )
 
-    def tearDown(self) -> None:
-        self.harness.cleanup()
-
 
 class TestNFSClientCharm(unittest.TestCase):
     """Test nfs_interfaces from the requirer side."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.harness = Harness(NFSClientCharm, meta=NFS_CLIENT_METADATA)
+        cls.integration_id = cls.harness.add_relation(NFS_INTEGRATION_NAME, "application")
+        cls.harness.add_relation_unit(cls.integration_id, "application/0")
+        cls.harness.set_leader(True)
+        cls.harness.begin_with_initial_hooks()
+        # Patch the event handlers once for the whole class; `setUp` resets the
+        # mocks so each test still starts from a clean call history.
+        for handler in ("_on_server_connected", "_on_mount_share", "_on_umount_share"):
+            patcher = patch.object(NFSClientCharm, handler)
+            setattr(cls, f"mock{handler}", patcher.start())
+            cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.harness.cleanup()
+
     def setUp(self) -> None:
-        self.harness = Harness(NFSClientCharm, meta=NFS_CLIENT_METADATA)
-        self.integration_id = self.harness.add_relation(NFS_INTEGRATION_NAME, "application")
-        self.harness.add_relation_unit(self.integration_id, "application/0")
-        self.harness.set_leader(True)
-        self.harness.begin_with_initial_hooks()
-
-    @patch.object(NFSClientCharm, "_on_server_connected")
-    def test_on_server_connected(self, _on_server_connected) -> None:
+        _reset_integration(self.harness, self.integration_id, "application/0")
+        self.mock_on_server_connected.reset_mock()
+        self.mock_on_mount_share.reset_mock()
+        self.mock_on_umount_share.reset_mock()
+
+    def test_on_server_connected(self) -> None:
         """Assert that correct hook is called when new server is connected."""
         # Add placeholder unit to trigger a `relation-joined` event.
         self.harness.add_relation_unit(self.integration_id, "application/1")
-        _on_server_connected.assert_called_once()
+        self.mock_on_server_connected.assert_called_once()
+        # Roll back so later tests see the original single-unit integration.
+        self.harness.remove_relation_unit(self.integration_id, "application/1")
 
-    @patch.object(NFSClientCharm, "_on_mount_share")
-    def test_on_mount_share(self, _on_mount_share) -> None:
+    def test_on_mount_share(self) -> None:
         """Assert that correct hook is called when NFS share is ready to mount."""
         # Simulate server setting new NFS share endpoint
         self.harness.update_relation_data(
@@ -123,12 +164,11 @@ class TestNFSClientCharm(unittest.TestCase):
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_mount_share.assert_called_once()
-        event = _on_mount_share.call_args[0][0]
+        self.mock_on_mount_share.assert_called_once()
+        event = self.mock_on_mount_share.call_args[0][0]
         self.assertEqual(event.endpoint, endpoint)
 
-    @patch.object(NFSClientCharm, "_on_umount_share")
-    def test_on_umount_share(self, _on_umount_share) -> None:
+    def test_on_umount_share(self) -> None:
         """Assert that correct hook is called when NFS share is ready to be unmounted."""
         # Disconnect the related unit to trigger `relation-departed`.
         self.harness.remove_relation_unit(self.integration_id, "application/0")
@@ -140,8 +180,8 @@ class TestNFSClientCharm(unittest.TestCase):
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_umount_share.assert_called_once()
-        event = _on_umount_share.call_args[0][0]
+        self.mock_on_umount_share.assert_called_once()
+        event = self.mock_on_umount_share.call_args[0][0]
         self.assertEqual(event.endpoint, endpoint)
 
     def test_request_share(self) -> None:
@@ -169,22 +209,32 @@ class TestNFSClientCharm(unittest.TestCase):
             {"name": "/data", "allowlist": "0.0.0.0", "size": "-1"},
         )
 
-    def tearDown(self) -> None:
-        self.harness.cleanup()
-
 
 class TestNFSServerCharm(unittest.TestCase):
     """Test nfs_interfaces from the provider side."""
 
-    def setUp(self):
-        self.harness = Harness(NFSServerCharm, meta=NFS_SERVER_METADATA)
-        self.integration_id = self.harness.add_relation(NFS_INTEGRATION_NAME, "application")
-        self.harness.add_relation_unit(self.integration_id, "application/0")
-        self.harness.set_leader(True)
-        self.harness.begin_with_initial_hooks()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.harness = Harness(NFSServerCharm, meta=NFS_SERVER_METADATA)
+        cls.integration_id = cls.harness.add_relation(NFS_INTEGRATION_NAME, "application")
+        cls.harness.add_relation_unit(cls.integration_id, "application/0")
+        cls.harness.set_leader(True)
+        cls.harness.begin_with_initial_hooks()
+        # Patch the event handler once for the whole class; `setUp` resets the
+        # mock so each test still starts from a clean call history.
+        patcher = patch.object(NFSServerCharm, "_on_share_requested")
+        cls.mock_on_share_requested = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.harness.cleanup()
 
-    @patch.object(NFSServerCharm, "_on_share_requested")
-    def test_on_share_requested(self, _on_share_requested) -> None:
+    def setUp(self) -> None:
+        _reset_integration(self.harness, self.integration_id, "application/0")
+        self.mock_on_share_requested.reset_mock()
+
+    def test_on_share_requested(self) -> None:
         """Assert that correct hook is called when a new NFS share is requested."""
         # Simulate the request of a new NFS share.
         self.harness.update_relation_data(
@@ -198,8 +248,8 @@ class TestNFSServerCharm(unittest.TestCase):
         )
 
         # Assert the correct event handler is invoked and event parameters are passed.
-        _on_share_requested.assert_called_once()
-        event = _on_share_requested.call_args[0][0]
+        self.mock_on_share_requested.assert_called_once()
+        event = self.mock_on_share_requested.call_args[0][0]
         self.assertEqual(event.name, name)
         self.assertEqual(event.allowlist, allowlist)
         self.assertEqual(event.size, size)
@@ -211,6 +261,3 @@ class TestNFSServerCharm(unittest.TestCase):
             self.harness.get_relation_data(self.integration_id, "nfs-server"),
             {"endpoint": "nfs://127.0.0.1/data"},
         )
-
-    def tearDown(self) -> None:
-        self.harness.cleanup()